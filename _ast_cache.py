@@ -0,0 +1,25 @@
+"""On-disk cache of extracted module info for update_init.py.
+
+Entries are pickled payloads keyed by a content digest, so repeated
+runs of the generator skip ast.parse entirely for unchanged sources.
+"""
+import pickle
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "nodeweaver" / "ast"
+
+
+def load(digest: str):
+    """Return the cached payload for ``digest``, or None on a miss."""
+    try:
+        with open(CACHE_DIR / f"{digest}.pkl", "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def store(digest: str, payload) -> None:
+    """Persist ``payload`` under ``digest``."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / f"{digest}.pkl", "wb") as f:
+        pickle.dump(payload, f)
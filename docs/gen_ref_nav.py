@@ -0,0 +1,72 @@
+"""Generate the code reference pages and navigation for mkdocs.
+
+Executed by mkdocs-gen-files during the docs build; emits one stub page per
+Python module pointing mkdocstrings at it, plus the literate-nav SUMMARY.
+"""
+import os
+from pathlib import Path
+
+import mkdocs_gen_files
+
+#: Top-level nodeweaver packages that get reference pages.
+MODULE_PATHS = ["core", "managers", "utils"]
+
+package_root = Path(__file__).parent.parent / "python3.10libs" / "nodeweaver"
+
+nav = mkdocs_gen_files.Nav()
+
+
+def iter_py(roots):
+    """Yield paths of every ``.py`` file under the given root directories.
+
+    Walks with one explicit ``os.scandir`` stack seeded with every root, so
+    entry types come from the directory read itself — no per-entry ``stat``
+    and no intermediate Path objects like ``Path.rglob`` creates, and one
+    traversal covers all target packages.
+    """
+    stack = [os.fspath(r) for r in roots]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
+
+# One walk over every target package instead of re-entering the
+# filesystem per module. First pass builds the nav and the page contents;
+# the second pass performs all generated-file writes back to back.
+module_roots = [package_root / m for m in MODULE_PATHS if (package_root / m).exists()]
+pages = []
+for path in sorted(iter_py(module_roots)):
+    path = Path(path)
+    module_py = path.relative_to(package_root).with_suffix("")
+    doc_path = path.relative_to(package_root).with_suffix(".md")
+    full_doc_path = Path("reference", doc_path)
+
+    parts = ("nodeweaver",) + module_py.parts
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+        doc_path = doc_path.with_name("index.md")
+        full_doc_path = full_doc_path.with_name("index.md")
+    elif parts[-1].startswith("_"):
+        continue
+
+    nav[parts] = doc_path.as_posix()
+    pages.append(
+        (
+            full_doc_path,
+            path.relative_to(package_root.parent.parent),
+            f"::: {'.'.join(parts)}\n",
+        )
+    )
+
+for full_doc_path, edit_path, content in pages:
+    with mkdocs_gen_files.open(full_doc_path, "w") as fd:
+        fd.write(content)
+    mkdocs_gen_files.set_edit_path(full_doc_path, edit_path)
+
+literate_nav = list(nav.build_literate_nav())
+with mkdocs_gen_files.open("reference/SUMMARY.md", "w") as nav_file:
+    nav_file.writelines(literate_nav)
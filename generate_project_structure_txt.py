@@ -0,0 +1,90 @@
+"""Generate a text snapshot of the repository's directory structure.
+
+Run from the repository root to produce ``project_structure.txt``, a simple
+indented tree of every tracked-ish file. Used when updating the docs and when
+sharing the project layout in issues.
+"""
+import os
+
+IGNORE_PATTERNS = [
+    ".git",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".vscode",
+    ".idea",
+    "venv",
+    ".venv",
+    "env",
+    "node_modules",
+    "backup",
+    "*.pyc",
+    "*.pyo",
+    "*.orig",
+    "*.swp",
+    "*.log",
+]
+
+
+# Precompiled views of IGNORE_PATTERNS: exact names get a hash lookup, the
+# ``*.ext`` patterns become one C-level str.endswith call against a tuple.
+_IGNORE_NAMES = frozenset(p for p in IGNORE_PATTERNS if not p.startswith("*."))
+_IGNORE_SUFFIXES = tuple(p[1:] for p in IGNORE_PATTERNS if p.startswith("*."))
+
+
+def should_ignore(name: str) -> bool:
+    """Return True if the entry ``name`` matches any of the ignore patterns.
+
+    Matches on the entry name only, so a pattern like ``env`` no longer
+    swallows unrelated paths such as ``environment.py``.
+    """
+    return name in _IGNORE_NAMES or name.endswith(_IGNORE_SUFFIXES)
+
+
+# Indent strings cached by depth so the walk never repeats the string
+# multiplication; grown on demand for unusually deep trees.
+_INDENTS = [""]
+
+
+def _indent(depth: int) -> str:
+    """Return the cached four-space indent string for ``depth``."""
+    while depth >= len(_INDENTS):
+        _INDENTS.append(_INDENTS[-1] + "    ")
+    return _INDENTS[depth]
+
+
+def scan_directory(root_dir: str, output_file: str = "project_structure.txt") -> None:
+    """Write an indented listing of ``root_dir`` to ``output_file``.
+
+    The traversal uses ``os.scandir`` recursively so each entry's type comes
+    from the cached directory read instead of a second ``stat`` call, and
+    entries are sorted once per directory.
+
+    Args:
+        root_dir: Directory to scan, typically the repository root.
+        output_file: Path of the text file to write.
+    """
+    output = []
+
+    def _walk(path: str, depth: int) -> None:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        indent = _indent(depth)
+        for entry in entries:
+            if should_ignore(entry.name):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                output.append("".join((indent, entry.name, "/")))
+                _walk(entry.path, depth + 1)
+            else:
+                output.append("".join((indent, entry.name)))
+
+    _walk(root_dir, 0)
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(output))
+
+
+if __name__ == "__main__":
+    scan_directory(".")
+    print("Wrote project_structure.txt")
@@ -0,0 +1,20 @@
+"""Node Weaver: tools for Houdini technical directors.
+
+Core modules:
+    hda_utils: flush_env_vars, replace_with_null, set_env_var, update_hda_sections_from_source_files
+    network_builder: NetworkBuilder
+    node_shape: CustomNodeShapeCreator, ValidationError
+    script_generator: ExpressionParser, HDAScriptManager, ScriptGenerator, ScriptInspector, create_action_script, create_menu_script, print_scripts_in_selected_nodes
+
+This file is auto-generated by update_init.py. Do not edit by hand.
+Content hash: 3809287f5db7d00d
+"""
+from . import core
+from . import managers
+from . import utils
+
+__all__ = [
+    "core",
+    "managers",
+    "utils",
+]
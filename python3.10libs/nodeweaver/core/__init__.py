@@ -0,0 +1,52 @@
+"""Core tool implementations for Node Weaver.
+
+This file is auto-generated by update_init.py. Do not edit by hand.
+Content hash: 36a4742de49ab90c
+"""
+from .hda_utils import (
+    flush_env_vars,
+    replace_with_null,
+    set_env_var,
+    update_hda_sections_from_source_files,
+)
+from .network_builder import NetworkBuilder
+from .node_shape import CustomNodeShapeCreator, ValidationError
+from .script_generator import (
+    ExpressionParser,
+    HDAScriptManager,
+    ScriptGenerator,
+    ScriptInspector,
+    create_action_script,
+    create_menu_script,
+    print_scripts_in_selected_nodes,
+)
+
+__all__ = [
+    "CustomNodeShapeCreator",
+    "ExpressionParser",
+    "HDAScriptManager",
+    "NetworkBuilder",
+    "ScriptGenerator",
+    "ScriptInspector",
+    "ValidationError",
+    "create_action_script",
+    "create_menu_script",
+    "flush_env_vars",
+    "print_scripts_in_selected_nodes",
+    "replace_with_null",
+    "set_env_var",
+    "update_hda_sections_from_source_files",
+]
+
+
+def reload_all():
+    """Reload every core module in place."""
+    import importlib
+    from . import hda_utils
+    importlib.reload(hda_utils)
+    from . import network_builder
+    importlib.reload(network_builder)
+    from . import node_shape
+    importlib.reload(node_shape)
+    from . import script_generator
+    importlib.reload(script_generator)
@@ -0,0 +1,65 @@
+"""Implementation details for parameter expression parsing.
+
+Use :class:`nodeweaver.core.script_generator.ExpressionParser` instead of
+importing from this module directly.
+"""
+import re
+
+#: Type prefixes MaterialX parameter names carry (int, float, vector, color,
+#: string, matrix, bool). Stored as a tuple so a single C-level
+#: ``str.startswith`` call tests all of them at once.
+_MATERIALX_PREFIXES = ("i_", "f_", "v_", "c_", "s_", "m_", "b_")
+
+
+def strip_materialx_type_prefixes(name: str) -> str:
+    """Return ``name`` without its MaterialX type prefix, if it has one."""
+    return name[2:] if name.startswith(_MATERIALX_PREFIXES) else name
+
+
+class _HoudiniExpressionParser:
+    """Parses channel references out of Houdini parameter expressions."""
+
+    _CHREF_RE = re.compile(r'ch[sfv]?\(\s*["\']([^"\']+)["\']\s*\)')
+
+    def __init__(self) -> None:
+        # Per-instance so one conversion session's resolutions never leak
+        # into the next; keyed by sessionId because node.path() is itself a
+        # Houdini API call.
+        self._chref_cache: dict = {}
+
+    def parse_and_resolve_channel_reference(self, node, channel_ref: str):
+        """Resolve a ``ch()``-style reference relative to ``node``.
+
+        Args:
+            node: The node whose parameter holds the expression.
+            channel_ref: The expression text, e.g. ``ch("../base_color")``.
+
+        Returns:
+            A ``(target_node, parm_name)`` tuple, or None when the text is
+            not a recognisable channel reference or the target node does not
+            exist.
+
+        Materials repeat the same reference (``ch("../base_color")``) across
+        dozens of parms, so results are memoized per
+        ``(node.sessionId(), channel_ref)``.
+        """
+        key = (node.sessionId(), channel_ref)
+        if key in self._chref_cache:
+            return self._chref_cache[key]
+        match = self._CHREF_RE.match(channel_ref.strip())
+        if match is None:
+            result = None
+        else:
+            ref_path = match.group(1)
+            dir_path, _, parm_name = ref_path.rpartition("/")
+            target = node.node(dir_path) if dir_path else node
+            result = None if target is None else (target, parm_name)
+        self._chref_cache[key] = result
+        return result
+
+
+#: Shared parser behind the static ExpressionParser wrappers. Its cache
+#: lives for the whole Houdini session and holds hou.Node wrappers, so
+#: conversion runs should prefer ExpressionParser.session() (a fresh
+#: parser whose cache dies with the run) or clear this one between runs.
+_DEFAULT_PARSER = _HoudiniExpressionParser()
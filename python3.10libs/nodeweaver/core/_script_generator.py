@@ -0,0 +1,99 @@
+"""Implementation details for the Tool Maker Tools script generator.
+
+Use the wrappers in :mod:`nodeweaver.core.script_generator` instead of
+importing from this module directly.
+"""
+import functools
+import json
+
+import hou
+
+
+@functools.cache
+def _load_config(path: str) -> dict:
+    """Load and cache the script-generator config JSON at ``path``."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _BaseScriptGenerator:
+    """Shared template lookup and substitution for the concrete generators."""
+
+    #: Top-level config key the subclass reads its templates from.
+    config_key = ""
+
+    def __init__(self, config_path: str) -> None:
+        self._config = _load_config(str(config_path))
+
+    def generate_script(self, category: str, name: str, options: dict) -> str:
+        """Expand the template for ``category``/``name`` with ``options``."""
+        try:
+            entry = self._config[self.config_key][category][name]
+        except KeyError as e:
+            raise KeyError(
+                f"No {self.config_key} template '{category}/{name}' in config"
+            ) from e
+        script = entry["template"]
+        for key, value in options.items():
+            script = script.replace(f"<{key}>", str(value))
+        return script
+
+
+class MenuScriptGenerator(_BaseScriptGenerator):
+    """Generates Python menu scripts for parameter menus."""
+
+    config_key = "menu_scripts"
+
+
+class ActionButtonGenerator(_BaseScriptGenerator):
+    """Generates Python callback scripts for parameter action buttons."""
+
+    config_key = "action_scripts"
+
+
+class HDAScriptUI:
+    """Drives the script-generator interface on the Tool Maker Tools HDA."""
+
+    def __init__(self, node: hou.Node) -> None:
+        self.node = node
+        # One generator held across interactive updates; only rebuilt when
+        # the script-type parm actually changes or the config is reloaded.
+        self._cached_gen = None
+        self._cached_type = None
+
+    def _get_generator(self, script_type: str):
+        if script_type == self._cached_type:
+            return self._cached_gen
+        from . import script_generator
+
+        self._cached_gen = script_generator.ScriptGenerator.create(script_type)
+        self._cached_type = script_type
+        return self._cached_gen
+
+    def reload_config(self) -> None:
+        """Drop cached generators; wired to the HDA's Reload Config button."""
+        from . import script_generator
+
+        self._cached_gen = None
+        self._cached_type = None
+        script_generator._make_generator.cache_clear()
+        _load_config.cache_clear()
+
+    def _read_options(self) -> dict:
+        """Collect placeholder values from the HDA's option parms."""
+        options = {}
+        for parm in self.node.globParms("option_*"):
+            options[parm.name()[len("option_"):]] = parm.evalAsString()
+        return options
+
+    def generate_script(self) -> str:
+        """Generate the script described by the node's current parm values."""
+        script_type = self.node.parm("script_type").evalAsString()
+        category = self.node.parm("script_category").evalAsString()
+        name = self.node.parm("script_name").evalAsString()
+        generator = self._get_generator(script_type)
+        return generator.generate_script(category, name, self._read_options())
+
+    def update_ui(self) -> None:
+        """Write the generated script into the preview parm."""
+        self.node.parm("script_preview").set(self.generate_script())
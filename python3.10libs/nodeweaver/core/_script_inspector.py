@@ -0,0 +1,52 @@
+"""Implementation details for the node script inspector shelf tool.
+
+Use :class:`nodeweaver.core.script_generator.ScriptInspector` instead of
+importing from this module directly.
+"""
+import hou
+
+#: Search modes accepted by find_scripts.
+SEARCH_ALL = 0
+SEARCH_CONTAINS = 1
+
+
+def find_scripts(node: hou.Node, search_mode: int = SEARCH_ALL, search_str: str = ""):
+    """Collect callback, expression and menu scripts from ``node``'s parms.
+
+    Pulls ``node.parms()`` and the parm templates once, then inspects only
+    the parms that can actually carry a script, keeping the number of
+    Houdini API crossings proportional to the scriptable parms rather than
+    every parm times every probe.
+
+    Args:
+        node: Node to inspect.
+        search_mode: SEARCH_ALL returns everything; SEARCH_CONTAINS keeps
+            only scripts containing ``search_str``.
+        search_str: Substring filter used with SEARCH_CONTAINS.
+
+    Returns:
+        A list of ``(parm_name, kind, script)`` tuples where kind is one of
+        "callback", "expression" or "menu".
+    """
+    parms = node.parms()
+    if not parms:
+        return []
+    templates = [p.parmTemplate() for p in parms]
+
+    found = []
+    for parm, template in zip(parms, templates):
+        callback = template.scriptCallback()
+        if callback:
+            found.append((parm.name(), "callback", callback))
+        if parm.keyframes():
+            expression = parm.expression()
+            if expression:
+                found.append((parm.name(), "expression", expression))
+        if isinstance(
+            template, (hou.MenuParmTemplate, hou.StringParmTemplate)
+        ) and template.itemGeneratorScript():
+            found.append((parm.name(), "menu", template.itemGeneratorScript()))
+
+    if search_mode == SEARCH_CONTAINS and search_str:
+        found = [item for item in found if search_str in item[2]]
+    return found
@@ -0,0 +1,120 @@
+"""HDA definition and session utilities."""
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import hou
+
+#: True once set_env_var has changed something the hip file should keep.
+_dirty = False
+
+
+def set_env_var(name: str, value: str) -> None:
+    """Set a session environment variable without saving the hip file.
+
+    The save is deferred: setting several variables in sequence costs
+    one scene serialization via flush_env_vars (registered at exit)
+    instead of one per call.
+    """
+    global _dirty
+    hou.putenv(name, value)
+    _dirty = True
+
+
+def flush_env_vars() -> None:
+    """Persist pending environment-variable changes with one hip save."""
+    global _dirty
+    if _dirty:
+        hou.hipFile.save(None, False)
+        _dirty = False
+
+
+atexit.register(flush_env_vars)
+
+#: Lazily resolved null SOP type; caching it skips the per-call
+#: category/name lookup.
+_NULL_TYPE = None
+
+
+def _null_type():
+    global _NULL_TYPE
+    if _NULL_TYPE is None:
+        _NULL_TYPE = hou.sopNodeTypeCategory().nodeType("null")
+    return _NULL_TYPE
+
+
+def replace_with_null(node: hou.Node, null_name: str) -> hou.Node:
+    """Return a null named ``null_name`` hanging off ``node``.
+
+    Reuses the node itself when it already is a null, or an existing
+    sibling with the target name, so repeat calls in output-building
+    loops skip the create path entirely.
+    """
+    # NodeType wrappers are not singletons, so compare by equality.
+    if node.type() == _null_type():
+        return node
+    existing = node.parent().node(null_name)
+    if existing is not None:
+        return existing
+    return node.createOutputNode("null", null_name)
+
+
+def update_hda_sections_from_source_files(node: hou.Node) -> None:
+    """Refresh an HDA's sections from their linked source files.
+
+    Sections whose extra-file options carry a ``<name>/Source`` entry
+    are re-read from that path and written back into the definition.
+    Missing files are reported and skipped; the read itself is the
+    probe, so no separate exists() stat is paid per section.
+    """
+    definition = node.type().definition()
+    if definition is None:
+        return
+    desc = definition.description()
+    extra_options = definition.extraFileOptions()
+    sections = definition.sections()
+    # One .get per section instead of a membership test plus a second
+    # lookup; sections with a linked source become a flat work list.
+    # Blank entries would otherwise resolve to Path(".") and fail the
+    # read with a confusing per-section warning.
+    work = []
+    for name, section in sections.items():
+        source = extra_options.get(f"{name}/Source")
+        if source is None or not source.strip():
+            continue
+        work.append((name, section, Path(hou.text.expandString(source.strip()))))
+
+    if not work:
+        return
+
+    def _read(source_path):
+        # Raw bytes skip the TextIOWrapper layer; the emptiness test
+        # runs on the bytes and only kept content pays the decode.
+        # Zero-byte sources are caught by the stat so they never pay
+        # the open/read at all.
+        try:
+            if source_path.stat().st_size == 0:
+                return b"", None
+            return source_path.read_bytes(), None
+        except FileNotFoundError:
+            return None, f"source file not found: {source_path}"
+        except OSError as exc:
+            return None, str(exc)
+
+    # Phase one reads everything — the reads release the GIL, so a
+    # small pool overlaps them. Phase two mutates the definition on
+    # this thread, so a read failure never leaves the HDA half-updated.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reads = pool.map(_read, [source_path for _, _, source_path in work])
+
+    pending = []
+    for (name, section, _), (data, error) in zip(work, reads):
+        if error is not None:
+            print(f"{desc}: could not read source for section '{name}': {error}")
+        elif data.strip():
+            pending.append((section, data.decode("utf-8")))
+        else:
+            print(f"{desc}: skipped empty source for section '{name}'")
+
+    for section, contents in pending:
+        section.setContents(contents)
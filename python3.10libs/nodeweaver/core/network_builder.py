@@ -0,0 +1,48 @@
+"""Builds node networks from the JSON templates shipped with the repo."""
+from pathlib import Path
+
+import hou
+
+from ..utils import files
+
+#: Directory holding the network template JSON files.
+TEMPLATE_DIR = Path(__file__).parents[3] / "config" / "templates"
+
+
+class NetworkBuilder:
+    """Creates example networks inside a parent node from template files."""
+
+    def __init__(self, parent: hou.Node) -> None:
+        self.parent = parent
+
+    def build_from_template(self, template_name: str) -> list:
+        """Create the nodes described by ``template_name``.
+
+        Repeat builds in a session reuse the parsed template through
+        files.read_json's mtime-keyed cache; editing the JSON on disk
+        still takes effect on the next build.
+
+        Args:
+            template_name: Stem of a JSON file in the template directory.
+
+        Returns:
+            The created nodes, in template order.
+        """
+        template = files.read_json(TEMPLATE_DIR / f"{template_name}.json")
+        created = {}
+        # The build is all-or-nothing, so recording per-node undo
+        # entries just burns memory; one disabler covers the lot. The
+        # templates carry every parm value themselves, which lets the
+        # init scripts be skipped on creation too.
+        with hou.undos.disabler():
+            for spec in template["nodes"]:
+                node = self.parent.createNode(
+                    spec["type"], spec["name"], run_init_scripts=False
+                )
+                for parm_name, value in spec.get("parms", {}).items():
+                    node.parm(parm_name).set(value)
+                created[spec["name"]] = node
+            for dst, input_index, src in template.get("connections", []):
+                created[dst].setInput(input_index, created[src])
+            self.parent.layoutChildren(list(created.values()))
+        return list(created.values())
@@ -0,0 +1,271 @@
+"""Custom Node Shape Creator: export, import and inspect node shape files."""
+from pathlib import Path
+
+import hou
+import numpy as np
+
+from ..utils import files, parsing
+from .network_builder import NetworkBuilder
+
+#: Example network templates, indexed by the example menu parm value.
+_TEMPLATES = (
+    "simple_clip_method",
+    "complex_constructed_method",
+    "honeycomb_trace_method",
+)
+
+
+class ValidationError(Exception):
+    """Raised when a shape export is attempted with invalid parameters."""
+
+
+class CustomNodeShapeCreator:
+    """Drives the Custom Node Shape Creator HDA."""
+
+    def __init__(self, node: hou.Node) -> None:
+        self.node = node
+        self.builder = NetworkBuilder(node.parent())
+        # The creator lives as long as the node (see _get_creator), so
+        # resolve the hot callback parms once instead of per invocation.
+        self._dir_parm = node.parm("dir")
+        self._name_parm = node.parm("shape_name")
+        self._path_parm = node.parm("path")
+        self._lbl_path_parm = node.parm("lbl_path")
+        self._restrict_parm = node.parm("restrict_to_shape")
+        self._scale_parm = node.parm("icon_scale")
+
+    def export_shape_data(self) -> None:
+        """Write the current shape to the JSON file named by the path parm."""
+        # Validate before update_path so an empty name short-circuits
+        # without paying for the expandString/normpath and parm writes.
+        name = self._name_parm.eval()
+        if not name:
+            raise ValidationError("Shape name is empty.")
+        self.update_path()
+
+        geo = self.node.node("JSON_OUT").geometry()
+        out_path = self._path_parm.eval()
+
+        # Pull every attribute in one tight pass up front, then parse from
+        # the dict — the HOM crossings happen back to back instead of being
+        # interleaved with parsing.
+        attr_names = ["outline", "inputs", "outputs", "icon"] + [
+            f"flag{i}_outline" for i in range(4)
+        ]
+        raw = {n: geo.stringListAttribValue(n) for n in attr_names}
+
+        def gen_list(attrib_name: str) -> list:
+            return parsing.parse_csv_lines(raw[attrib_name])
+
+        def data_items():
+            # Lazy per-key parsing: only one attribute's array is alive at
+            # a time while the file streams out.
+            yield "name", name
+            yield "flags", {
+                str(i): {"outline": gen_list(f"flag{i}_outline")} for i in range(4)
+            }
+            yield "outline", gen_list("outline")
+            yield "inputs", gen_list("inputs")
+            yield "outputs", gen_list("outputs")
+            yield "icon", gen_list("icon")
+
+        files.write_json_streaming(out_path, data_items())
+
+    def fill_node_shape_parameters(self, path: str = None) -> None:
+        """Load a shape JSON file back onto the HDA's parameters.
+
+        Args:
+            path: Optional explicit file path; defaults to the path parm.
+
+        The whole write phase runs with update mode forced to Manual and
+        undo recording off, so a 500-point outline triggers one cook at the
+        end instead of a dependency update per parm set.
+        """
+        data = files.read_json(path or self.node.evalParm("path"))
+        node = self.node
+        previous_mode = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
+        try:
+            with hou.undos.disabler():
+                self.clear_parameters()
+
+                for key in ("outline", "inputs", "outputs"):
+                    value = data[key]
+                    node.parm(f"mparm_{key}").set(len(value))
+                    for i, pos in enumerate(value):
+                        node.parmTuple(f"{key}_pos{i}").set(pos[:2])
+                        if len(pos) > 2:
+                            node.parm(f"{key}_angle{i}").set(pos[2])
+
+                for num in range(4):
+                    value = data["flags"][str(num)]["outline"]
+                    node.parm(f"mparm_flag{num}").set(len(value))
+                    for i, pos in enumerate(value):
+                        node.parmTuple(f"flag{num}_pos{i}").set(pos[:2])
+
+                icon = data["icon"]
+                if icon:
+                    xs = [p[0] for p in icon]
+                    ys = [p[1] for p in icon]
+                    node.parmTuple("icon_min").set((min(xs), min(ys)))
+                    node.parmTuple("icon_max").set((max(xs), max(ys)))
+        finally:
+            hou.setUpdateMode(previous_mode)
+
+    #: Everything clear_parameters resets, as one setParms payload.
+    _CLEAR_VALUES = {
+        "mparm_outline": 0,
+        "mparm_inputs": 0,
+        "mparm_outputs": 0,
+        "mparm_flag0": 0,
+        "mparm_flag1": 0,
+        "mparm_flag2": 0,
+        "mparm_flag3": 0,
+        "icon_minx": 0.0,
+        "icon_miny": 0.0,
+        "icon_maxx": 0.0,
+        "icon_maxy": 0.0,
+    }
+
+    def clear_parameters(self) -> None:
+        """Reset the shape multiparms and icon bounds in one batch set."""
+        self.node.setParms(self._CLEAR_VALUES)
+
+    def generate_statistics(self) -> None:
+        """Refresh the stats labels from the inspection geometries.
+
+        Each label remembers the bounds it was last formatted from in the
+        node's cached user data, so unchanged geometries skip both the
+        formatting and the parm write.
+        """
+        digits = 3
+        node = self.node
+        for lbl in ("outline", "inputs", "outputs", "icon"):
+            geo = node.node(f"{lbl.upper()}_STATS").geometry()
+            bb = geo.boundingBox()
+            key = (tuple(bb.minvec()), tuple(bb.maxvec()))
+            cache_name = f"_stats_{lbl}"
+            if node.cachedUserData(cache_name) == key:
+                continue
+            # One rounded (4, 2) array instead of eight round() calls and
+            # their per-value float allocations.
+            arr = np.round(
+                np.array([bb.minvec(), bb.maxvec(), bb.sizevec(), bb.center()])[:, :2],
+                digits,
+            )
+            stats = (
+                "X: {} to {}  |  Y: {} to {}  |  "
+                "Size: {} x {}  |  Center: {} x {}".format(*arr.flatten())
+            )
+            node.parm(f"lbl_{lbl}").set(stats)
+            node.setCachedUserData(cache_name, key)
+
+    def create_example(self, example: int) -> None:
+        """Build one of the example shape networks next to the HDA.
+
+        Args:
+            example: Index of the example template to build.
+        """
+        if not 0 <= example < len(_TEMPLATES):
+            return
+        template = _TEMPLATES[example]
+        # One undo record and one cook for the whole reset instead of a
+        # dependency update per reverted parm.
+        previous_mode = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
+        try:
+            with hou.undos.group("Reset Shape Parameters"):
+                # A locked-parm check is a plain attribute read; cheaper
+                # than letting revertToDefaults raise per locked parm.
+                for parm in self.node.parms():
+                    if parm.isLocked():
+                        continue
+                    parm.revertToDefaults()
+        finally:
+            hou.setUpdateMode(previous_mode)
+        self.builder.build_from_template(template)
+
+    def update_path(self) -> None:
+        """Rebuild the output file path from the dir and shape name parms.
+
+        Writing a parm dirties the dependency graph even when the value
+        is identical, so both sets are skipped when nothing changed —
+        this fires on every keystroke in the name field.
+        """
+        directory = self._dir_parm.eval()
+        name = self._name_parm.eval()
+        new_path = hou.text.normpath(
+            hou.text.expandString(str(Path(directory) / f"{name}.json"))
+        )
+        if self._path_parm.evalAsString() != new_path:
+            self._path_parm.set(new_path)
+        if self._lbl_path_parm.evalAsString() != new_path:
+            self._lbl_path_parm.set(new_path)
+
+    def update_size(self) -> None:
+        """Clamp the icon scale to the shape bounds when restricted.
+
+        The bounds only change when the shape SOP recooks, so the last
+        (cook count, bounds) pair is kept in the node's cached user data
+        and reused while the geometry is unchanged.
+        """
+        if not self._restrict_parm.eval():
+            return
+        scale = self._scale_parm.eval()
+        sop = self.node.node("Set_groups_colors")
+        cook_count = sop.cookCount()
+        cached = self.node.cachedUserData("_size_cache")
+        if cached is not None and cached[0] == cook_count:
+            bounds = cached[1]
+        else:
+            size = sop.geometry().boundingBox().sizevec()
+            bounds = (size[0], size[1])
+            self.node.setCachedUserData("_size_cache", (cook_count, bounds))
+        clamped = min(*bounds, scale)
+        if clamped != scale:
+            self._scale_parm.set(clamped)
+
+
+def match_start(kwargs: dict) -> None:
+    """Parm callback keeping a curve's end value matched to its start."""
+    node = kwargs["node"]
+    parm_name = kwargs["parm_name"]
+    # Toggle off is the common case; bail before resolving the end parm.
+    if not node.parm(parm_name.replace("start", "end_match")).eval():
+        return
+    end_parm = node.parm(parm_name.replace("start", "end"))
+    end_parm.set(node.parm(parm_name).eval())
+
+
+def _get_creator(node: hou.Node) -> CustomNodeShapeCreator:
+    """Return the node's cached creator, building it on first use.
+
+    The instance is stashed in the node's cached user data, so repeated
+    callbacks on the same HDA reuse one creator instead of constructing
+    a fresh one (and a fresh NetworkBuilder) per parm press.
+    """
+    creator = node.cachedUserData("_nw_shape_creator")
+    if creator is None:
+        creator = CustomNodeShapeCreator(node)
+        node.setCachedUserData("_nw_shape_creator", creator)
+    return creator
+
+
+def on_example_create(kwargs: dict) -> None:
+    """HDA callback: build the selected example network."""
+    _get_creator(kwargs["node"]).create_example(kwargs["parm"].eval())
+
+
+def on_export_shape(kwargs: dict) -> None:
+    """HDA callback: export the current shape."""
+    _get_creator(kwargs["node"]).export_shape_data()
+
+
+def on_update_path(kwargs: dict) -> None:
+    """HDA callback: refresh the output path parms."""
+    _get_creator(kwargs["node"]).update_path()
+
+
+def on_update_size(kwargs: dict) -> None:
+    """HDA callback: clamp the icon scale to the shape."""
+    _get_creator(kwargs["node"]).update_size()
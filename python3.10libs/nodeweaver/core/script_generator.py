@@ -0,0 +1,241 @@
+"""Public interface for the Tool Maker Tools script generator.
+
+Everything the HDAs and shelf tools should touch lives here; the classes in
+``_script_generator`` are implementation detail and may change between
+releases.
+"""
+import functools
+from pathlib import Path
+from typing import Optional
+
+from . import _expression_parser, _script_generator, _script_inspector
+
+#: Default configuration shipped with the repository.
+DEFAULT_CONFIG = (
+    Path(__file__).parents[3] / "config" / "script_generator" / "default.json"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_generator(script_type: str, config_path: str):
+    """Build (or fetch the cached) generator impl for ``script_type``.
+
+    Cached by ``(script_type, config_path)`` so repeated UI callbacks reuse
+    one generator and its parsed config instead of reparsing the JSON per
+    call.
+    """
+    if script_type == "menu":
+        return _script_generator.MenuScriptGenerator(config_path)
+    if script_type == "action":
+        return _script_generator.ActionButtonGenerator(config_path)
+    raise ValueError(f"Unknown script type: '{script_type}'")
+
+
+#: Upper bound on cached generated scripts per generator.
+_CACHE_MAX = 512
+
+
+class ScriptGenerator:
+    """Generates menu and action-button scripts from the config templates."""
+
+    def __init__(self, impl) -> None:
+        self._impl = impl
+        self._cache: dict = {}
+
+    @classmethod
+    def create(
+        cls, script_type: str, config_path: Optional[str] = None
+    ) -> "ScriptGenerator":
+        """Create a generator for ``script_type`` ("menu" or "action").
+
+        Args:
+            script_type: Which family of scripts to generate.
+            config_path: Optional path to an alternate config JSON. Defaults
+                to the config shipped with the repository.
+
+        Returns:
+            A ScriptGenerator wrapping a cached implementation instance.
+        """
+        if config_path is None:
+            config_path = DEFAULT_CONFIG
+        return cls(_make_generator(script_type, str(Path(config_path).resolve())))
+
+    def generate_script(
+        self, category: str, name: str, options: Optional[dict] = None
+    ) -> str:
+        """Return the script for ``name`` in ``category``.
+
+        Args:
+            category: Config category, e.g. "nodes" or "attributes".
+            name: Template name within the category.
+            options: Placeholder values substituted into the template.
+
+        Menu expansion calls this with the same arguments over and over, so
+        results are cached by ``(category, name, options)`` with ``options``
+        canonicalised to a sorted tuple; the oldest entry is evicted once the
+        cache exceeds ``_CACHE_MAX``.
+        """
+        key = (category, name, tuple(sorted(options.items())) if options else ())
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        script = self._impl.generate_script(category, name, options or {})
+        if len(self._cache) >= _CACHE_MAX:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = script
+        return script
+
+    def clear_cache(self) -> None:
+        """Drop cached scripts, e.g. after the HDA reloads its config."""
+        self._cache.clear()
+
+
+def create_menu_script(
+    category: str,
+    name: str,
+    options: Optional[dict] = None,
+    config_path: Optional[str] = None,
+) -> str:
+    """Convenience wrapper generating a parameter menu script."""
+    return ScriptGenerator.create("menu", config_path).generate_script(
+        category, name, options
+    )
+
+
+def create_action_script(
+    category: str,
+    name: str,
+    options: Optional[dict] = None,
+    config_path: Optional[str] = None,
+) -> str:
+    """Convenience wrapper generating an action button script."""
+    return ScriptGenerator.create("action", config_path).generate_script(
+        category, name, options
+    )
+
+
+class ExpressionParser:
+    """Static helpers for working with parameter expressions.
+
+    Used by the copy-to-points conversion when rewiring ``ch()`` references
+    onto parameter nodes.
+    """
+
+    #: Tuple of MaterialX type prefixes, exposed for callers that need it.
+    MATERIALX_PREFIXES = _expression_parser._MATERIALX_PREFIXES
+
+    @staticmethod
+    def strip_materialx_type_prefixes(name: str) -> str:
+        """Return ``name`` without its MaterialX type prefix, if any."""
+        return _expression_parser.strip_materialx_type_prefixes(name)
+
+    @staticmethod
+    def parse_and_resolve_channel_reference(node, channel_ref: str):
+        """Resolve a ``ch()``-style reference relative to ``node``.
+
+        Returns a ``(target_node, parm_name)`` tuple or None. Resolutions
+        are memoized on a module-lifetime parser; conversion runs should
+        go through :meth:`session` so their cached node references are
+        dropped with the run.
+        """
+        return _expression_parser._DEFAULT_PARSER.parse_and_resolve_channel_reference(
+            node, channel_ref
+        )
+
+    @staticmethod
+    def session():
+        """Return a parser with its own resolution cache.
+
+        The returned object has the same
+        ``parse_and_resolve_channel_reference(node, channel_ref)`` method;
+        its cache — which holds resolved ``hou.Node`` wrappers that go
+        stale when targets are deleted — lives only as long as the caller
+        keeps the parser, instead of for the whole Houdini session.
+        """
+        return _expression_parser._HoudiniExpressionParser()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the default parser's memoized resolutions.
+
+        Call between conversion runs that use the static wrapper, so
+        stale node references from deleted targets are not served again.
+        """
+        _expression_parser._DEFAULT_PARSER._chref_cache.clear()
+
+
+class ScriptInspector:
+    """Prints the scripts living on a node's parameters.
+
+    Backs the Node Weaver shelf tool that dumps callback scripts, default
+    value expressions and menu scripts for the selected nodes.
+    """
+
+    def __init__(self) -> None:
+        self.search_mode = None
+        self.search_str = ""
+
+    def _prompt_search(self) -> None:
+        """Ask once whether to filter the found scripts by a substring."""
+        import hou
+
+        choice = hou.ui.displayMessage(
+            "Filter scripts by a search string?",
+            buttons=("Show All", "Search"),
+        )
+        if choice == 1:
+            _, text = hou.ui.readInput("Search for:", buttons=("OK",))
+            self.search_mode = _script_inspector.SEARCH_CONTAINS
+            self.search_str = text
+        else:
+            self.search_mode = _script_inspector.SEARCH_ALL
+
+    def search_scripts(self, node) -> list:
+        """Return the scripts found on ``node``, prompting for a filter once."""
+        if self.search_mode is None:
+            self._prompt_search()
+        return _script_inspector.find_scripts(node, self.search_mode, self.search_str)
+
+
+def print_scripts_in_selected_nodes() -> None:
+    """Print every script found on the currently selected nodes.
+
+    Output is buffered into one write per node; node.path() is fetched once
+    per node rather than per line.
+    """
+    import sys
+
+    import hou
+
+    inspector = ScriptInspector()
+    rule = "-" * 40
+    for node in tuple(hou.selectedNodes()):
+        found = inspector.search_scripts(node)
+        lines = [f"\nScripts found in {node.path()}:", rule]
+        if not found:
+            lines.append("(none)")
+        else:
+            for parm_name, kind, script in found:
+                lines.append(f"[{kind}] {parm_name}:")
+                lines.append(script)
+                lines.append(rule)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+class HDAScriptManager:
+    """Entry point used by the Tool Maker Tools HDA callbacks."""
+
+    def __init__(self, node) -> None:
+        self._impl = _script_generator.HDAScriptUI(node)
+
+    def update_ui(self) -> None:
+        """Refresh the preview parm from the current HDA parm values."""
+        self._impl.update_ui()
+
+    def generate_script(self) -> str:
+        """Generate the script described by the HDA's current parm values."""
+        return self._impl.generate_script()
+
+    def reload_config(self) -> None:
+        """Invalidate cached generators and config; Reload Config callback."""
+        self._impl.reload_config()
@@ -0,0 +1,25 @@
+"""Parameter-interface managers for the Node Weaver HDAs.
+
+This file is auto-generated by update_init.py. Do not edit by hand.
+Content hash: a2fcc9716e95098b
+"""
+from .color_palette import ColorPaletteConfigurator
+from .gradient import GradientManager
+from .text_color import TextColorManager
+
+__all__ = [
+    "ColorPaletteConfigurator",
+    "GradientManager",
+    "TextColorManager",
+]
+
+
+def reload_all():
+    """Reload every manager module in place."""
+    import importlib
+    from . import color_palette
+    importlib.reload(color_palette)
+    from . import gradient
+    importlib.reload(gradient)
+    from . import text_color
+    importlib.reload(text_color)
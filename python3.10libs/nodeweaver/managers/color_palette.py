@@ -0,0 +1,149 @@
+"""Palette editing callbacks for the Color Palette Configurator HDA."""
+import time
+from typing import Dict
+
+import hou
+import numpy as np
+
+from ..utils import colors as color_util
+
+
+#: Minimum interval between slider-driven parm writes, roughly one UI frame.
+_DEBOUNCE_INTERVAL = 0.016
+
+
+class ColorPaletteConfigurator:
+    """Manages the color multiparm on a Color Palette Configurator node."""
+
+    def __init__(self, node: hou.Node) -> None:
+        self.node = node
+        self._last_update: Dict[str, float] = {}
+        self._pending: Dict[str, str] = {}
+        self._flush_scheduled = False
+
+    @classmethod
+    def get_instance(cls, node: hou.Node) -> "ColorPaletteConfigurator":
+        """Return the configurator for ``node``, creating it on first use.
+
+        The instance is stashed in the node's cached user data (the same
+        idiom as node_shape's creator), which keeps it — and with it the
+        debounce state — alive between callbacks and drops it with the
+        node.
+        """
+        inst = node.cachedUserData("_nw_palette_configurator")
+        if inst is None:
+            inst = cls(node)
+            node.setCachedUserData("_nw_palette_configurator", inst)
+        return inst
+
+    def import_colors(self, file_path: str) -> None:
+        """Load a palette file into the color multiparm.
+
+        The multiparm is sized once with a bulk ``set`` instead of one
+        ``insertMultiParmInstance`` per color, and the whole write phase is
+        wrapped in a single undo group so dependents rebuild once. The file
+        body is parsed in one ``np.loadtxt`` call (skipping the count line
+        and the format tag column) rather than per-line Python splits.
+        """
+        arr = np.loadtxt(file_path, skiprows=1, usecols=(1, 2, 3), dtype=np.float32)
+        arr = arr.reshape(-1, 3)[::-1]
+        count = len(arr)
+        hex_ints = (arr * 255).astype(np.uint8)
+        hexes = ["{:02X}{:02X}{:02X}".format(*row) for row in hex_ints]
+
+        mparm = self.node.parm("colors")
+        with hou.undos.group("Import Colors"):
+            mparm.set(count)
+            # Resolve the instance parms once; the loop then only sets.
+            rgb_parms = [self.node.parmTuple(f"rgb{i + 1}") for i in range(count)]
+            hex_parms = [self.node.parm(f"hex{i + 1}") for i in range(count)]
+            for i in range(count):
+                rgb_parms[i].set(tuple(arr[i]))
+                hex_parms[i].set(hexes[i])
+
+    def export_colors(self, file_path: str) -> None:
+        """Write the current palette out to a palette file.
+
+        Each line is assembled with one join instead of repeated string
+        concatenation, and the header plus reversed body go out in a single
+        write with no insert-at-front list shifting.
+        """
+        mparm = self.node.parm("colors")
+        count = mparm.evalAsInt()
+        body = [
+            "D3 "
+            + " ".join(
+                f"{j:.3}"
+                for j in self.node.parmTuple(f"rgb{i + 1}").evalAsFloats()
+            )
+            for i in range(count)
+        ]
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(mparm.evalAsString() + "\n" + "\n".join(reversed(body)))
+
+    def reset_colors(self) -> None:
+        """Restore the default 36-color network-view palette.
+
+        Sizes the multiparm once and coalesces the writes into one undo
+        record, like :meth:`import_colors`.
+        """
+        default_colors = color_util.load_default_palette()
+        mparm = self.node.parm("colors")
+        count = len(default_colors)
+        with hou.undos.group("Reset Colors"):
+            mparm.set(count)
+            rgb_parms = [self.node.parmTuple(f"rgb{i + 1}") for i in range(count)]
+            hex_parms = [self.node.parm(f"hex{i + 1}") for i in range(count)]
+            for i, color in enumerate(reversed(default_colors)):
+                rgb_parms[i].set(color)
+                hex_parms[i].set(color_util.float_rgb_to_hex(*color))
+
+    def update_hex(self, kwargs: dict) -> None:
+        """RGB slider callback: refresh the matching hex field.
+
+        Debounced: drag storms within one UI frame coalesce into a single
+        write flushed on the next event-loop tick.
+        """
+        self._debounced("hex", str(kwargs["script_multiparm_index"]))
+
+    def update_rgb(self, kwargs: dict) -> None:
+        """Hex field callback: refresh the matching RGB tuple."""
+        self._debounced("rgb", str(kwargs["script_multiparm_index"]))
+
+    def _debounced(self, kind: str, idx: str) -> None:
+        now = time.monotonic()
+        if now - self._last_update.get(idx, 0.0) < _DEBOUNCE_INTERVAL:
+            self._pending[idx] = kind
+            self._schedule_flush()
+            return
+        self._last_update[idx] = now
+        self._sync(kind, idx)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        hou.ui.addEventLoopCallback(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        hou.ui.removeEventLoopCallback(self._flush_pending)
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        now = time.monotonic()
+        for idx, kind in pending.items():
+            self._last_update[idx] = now
+            self._sync(kind, idx)
+
+    def _sync(self, kind: str, idx: str) -> None:
+        if kind == "hex":
+            rgb = self.node.parmTuple("rgb" + idx).evalAsFloats()
+            self.node.parm("hex" + idx).set(color_util.float_rgb_to_hex(*rgb))
+            return
+        hex_val = self.node.parm("hex" + idx).evalAsString().lstrip("#")
+        if len(hex_val) != 6:
+            return
+        try:
+            rgb = color_util.hex_to_float_rgb(hex_val)
+        except ValueError:
+            return
+        self.node.parmTuple("rgb" + idx).set(rgb)
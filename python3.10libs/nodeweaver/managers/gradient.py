@@ -0,0 +1,119 @@
+"""Gradient tools for the Color Palette Configurator HDA."""
+import functools
+import json
+from pathlib import Path
+
+import hou
+import numpy as np
+
+from ..utils import colors as color_util
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cosine_presets() -> dict:
+    """Load and cache the cosine gradient presets shipped with the repo."""
+    path = (
+        Path(__file__).parents[3] / "config" / "gradients" / "gradient_presets.json"
+    )
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class GradientManager:
+    """Manages gradient creation on a Color Palette Configurator node."""
+
+    def __init__(self, node: hou.Node) -> None:
+        self.node = node
+
+    @classmethod
+    def get_instance(cls, node: hou.Node) -> "GradientManager":
+        """Return the manager for ``node``, creating it on first use.
+
+        Cached in the node's user data so repeat callbacks reuse one
+        instance and it is dropped with the node.
+        """
+        inst = node.cachedUserData("_nw_gradient_manager")
+        if inst is None:
+            inst = cls(node)
+            node.setCachedUserData("_nw_gradient_manager", inst)
+        return inst
+
+    def apply_cosine_preset(self) -> None:
+        """Copy the selected preset's coefficients onto the gradient parms."""
+        presets = _load_cosine_presets()
+        preset_parm = self.node.parm("cosine_presets")
+        items = preset_parm.menuItems()
+        coeffs = presets[items[preset_parm.eval()]]
+        for key in "abcd":
+            self.node.parmTuple(f"grad_{key}").set(tuple(coeffs[key]))
+        self.create_cosine_gradient()
+
+    def create_cosine_gradient(self) -> None:
+        """Rebuild the gradient ramp from the cosine coefficients.
+
+        Uses the palette formula ``a + b * cos(2pi * (c * t + d))`` per
+        channel (credit Inigo Quilez). The coefficients are read once and
+        every sample is computed in one vectorized ``np.cos`` call instead
+        of re-evaluating four parms per channel per sample.
+        """
+        count = self.node.parm("gradient_samples").evalAsInt()
+        if count < 2:
+            count = 2
+
+        # One evalParmTuple per coefficient vector: four API crossings for
+        # all twelve floats instead of one evalParm per component.
+        a = np.array(self.node.evalParmTuple("grad_a"))
+        b = np.array(self.node.evalParmTuple("grad_b"))
+        c = np.array(self.node.evalParmTuple("grad_c"))
+        d = np.array(self.node.evalParmTuple("grad_d"))
+
+        t = np.linspace(0.0, 1.0, count)
+        # (3, count): every channel of every sample in one trig call.
+        vals = a[:, None] + b[:, None] * np.cos(
+            2.0 * np.pi * (c[:, None] * t + d[:, None])
+        )
+
+        basis = [hou.rampBasis.Linear] * count
+        keys = t.tolist()
+        values = [tuple(row) for row in vals.T.tolist()]
+        self.node.parm("gradient_ramp").set(hou.Ramp(basis, keys, values))
+
+    def add_gradient_samples(self) -> None:
+        """Append the enabled gradient samples to the color multiparm.
+
+        The writes are coalesced into one undo group so the parameter
+        system rebuilds dependents once instead of per sample.
+        """
+        colors_mparm = self.node.parm("colors")
+        n_grads = self.node.parm("gradient_samples").evalAsInt()
+        tog_top = self.node.parm("add_to_top").eval()
+        ramp = self.node.parm("gradient_ramp").evalAsRamp()
+        with hou.undos.group("Add Gradient Samples"):
+            self._add_gradient_samples(colors_mparm, n_grads, tog_top, ramp)
+
+    def _add_gradient_samples(self, colors_mparm, n_grads, tog_top, ramp) -> None:
+        tog_parms = [self.node.parm(f"tog_grad{i + 1}") for i in range(n_grads)]
+        enabled = [i for i in range(n_grads) if tog_parms[i].eval()]
+        if not enabled:
+            return
+        denom = (n_grads - 1) if n_grads > 1 else 1
+        if tog_top:
+            # Front insertion has no bulk-resize equivalent; keep the
+            # per-sample insert on this path.
+            for i in enabled:
+                colors_mparm.insertMultiParmInstance(0)
+                color = ramp.lookup(i / denom)
+                self.node.parmTuple("rgb1").set(color)
+                self.node.parm("hex1").set(color_util.float_rgb_to_hex(*color))
+            return
+        # Append path: count the enabled slots first, grow the multiparm
+        # once, then write into the new tail slots.
+        base = colors_mparm.evalAsInt()
+        count = len(enabled)
+        colors_mparm.set(base + count)
+        rgb_parms = [self.node.parmTuple(f"rgb{base + k + 1}") for k in range(count)]
+        hex_parms = [self.node.parm(f"hex{base + k + 1}") for k in range(count)]
+        for k, i in enumerate(enabled):
+            color = ramp.lookup(i / denom)
+            rgb_parms[k].set(color)
+            hex_parms[k].set(color_util.float_rgb_to_hex(*color))
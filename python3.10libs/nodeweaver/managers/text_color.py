@@ -0,0 +1,118 @@
+"""Pasted-text color extraction for the Color Palette Configurator HDA."""
+import re
+
+import hou
+import numpy as np
+
+#: Mode 0: one hex color per line, optionally #-prefixed.
+_HEX_RE = re.compile(r"^#?([0-9a-fA-F]{6})\s*$")
+#: Mode 1: Adobe Color CSS export lines.
+_CSS_RE = re.compile(r"hex \{ color:\s*#?([0-9a-fA-F]{6})")
+
+
+def _hex_list_to_rgb(hexes) -> "np.ndarray":
+    """Convert a list of six-digit hex strings to an (n, 3) float array.
+
+    All strings are decoded with one bytes.fromhex call and normalised with
+    one vectorized divide instead of per-color Python arithmetic.
+    """
+    raw = bytes.fromhex("".join(hexes))
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.float32) / 255.0
+
+
+class TextColorManager:
+    """Extracts colors from text pasted into a Color Palette Configurator."""
+
+    def __init__(self, node: hou.Node) -> None:
+        self.node = node
+
+    @classmethod
+    def get_instance(cls, node: hou.Node) -> "TextColorManager":
+        """Return the manager for ``node``, creating it on first use.
+
+        Cached in the node's user data so repeat callbacks reuse one
+        instance and it is dropped with the node.
+        """
+        inst = node.cachedUserData("_nw_text_color_manager")
+        if inst is None:
+            inst = cls(node)
+            node.setCachedUserData("_nw_text_color_manager", inst)
+        return inst
+
+    def extract_text_colors(self, text: str, mode: int = 0, delete_lines: bool = True):
+        """Pull hex colors out of pasted text.
+
+        Matching runs through one precompiled pattern per mode instead of
+        hand-rolled startswith/find/slice chains per line.
+
+        Args:
+            text: The pasted text to scan.
+            mode: 0 for one hex color per line, 1 for Adobe CSS exports.
+            delete_lines: Whether the caller wants the leftover text back;
+                when False the remainder is never built.
+
+        Returns:
+            A ``(count, colors, new_text)`` tuple where colors is a list of
+            six-digit hex strings and new_text is the text with the matched
+            lines removed, or None when ``delete_lines`` is False.
+        """
+        if not text:
+            return 0, [], None
+        pat = _HEX_RE if mode == 0 else _CSS_RE
+        colors = []
+        count = 0
+        if not delete_lines:
+            # Fast path: no remainder wanted, so skip the list build + join.
+            for line in text.splitlines():
+                m = pat.search(line)
+                if m:
+                    colors.append(m.group(1))
+                    count += 1
+            return count, colors, None
+        new_text = []
+        for line in text.splitlines():
+            m = pat.search(line)
+            if m:
+                colors.append(m.group(1))
+                count += 1
+            else:
+                new_text.append(line)
+        return count, colors, "\n".join(new_text)
+
+    def add_text_samples(self) -> None:
+        """Append the colors found in the text parm to the color multiparm."""
+        text = self.node.parm("text").evalAsString()
+        mode = self.node.parm("text_mode").eval()
+        delete = bool(self.node.parm("delete_extracted").eval())
+        count, text_colors, new_text = self.extract_text_colors(text, mode, delete)
+        if not count:
+            return
+        mparm = self.node.parm("colors")
+        with hou.undos.group("Add Text Colors"):
+            base = mparm.evalAsInt()
+            mparm.set(base + count)
+            # Resolve the new instance parms once; the loop then only sets.
+            rgb_parms = [
+                self.node.parmTuple(f"rgb{base + i + 1}") for i in range(count)
+            ]
+            hex_parms = [
+                self.node.parm(f"hex{base + i + 1}") for i in range(count)
+            ]
+            rgb_arr = _hex_list_to_rgb(text_colors)
+            for i, color in enumerate(text_colors):
+                rgb_parms[i].set(tuple(rgb_arr[i]))
+                hex_parms[i].set(color.upper())
+            if new_text is not None:
+                self.node.parm("text").set(new_text)
+
+    def add_text_gradient(self) -> None:
+        """Build a gradient ramp from the colors found in the text parm."""
+        text = self.node.parm("text").evalAsString()
+        mode = self.node.parm("text_mode").eval()
+        count, text_colors, _ = self.extract_text_colors(text, mode, delete_lines=False)
+        if count < 2:
+            return
+        basis = [hou.rampBasis.Linear] * count
+        keys = [i / (count - 1) for i in range(count)]
+        values = [tuple(row) for row in _hex_list_to_rgb(text_colors)]
+        self.node.parm("gradient_ramp").set(hou.Ramp(basis, keys, values))
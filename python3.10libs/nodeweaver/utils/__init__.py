@@ -0,0 +1,18 @@
+"""Shared utilities for Node Weaver.
+
+This file is auto-generated by update_init.py. Do not edit by hand.
+Content hash: 93f22834c84ab352
+"""
+from . import action_buttons
+from . import colors
+from . import files
+from . import multiparm
+from . import parsing
+
+__all__ = [
+    "action_buttons",
+    "colors",
+    "files",
+    "multiparm",
+    "parsing",
+]
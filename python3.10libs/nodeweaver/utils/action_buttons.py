@@ -0,0 +1,49 @@
+"""Action-button callbacks shared by the Node Weaver HDAs."""
+import os
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import hou
+
+
+def _reveal(directory: str) -> None:
+    """Open ``directory`` in the OS file browser."""
+    if sys.platform.startswith("win"):
+        os.startfile(directory)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["open", directory])
+    else:
+        subprocess.Popen(["xdg-open", directory])
+
+
+def open_path(kwargs: dict) -> None:
+    """Reveal the parm's path in the OS file browser.
+
+    One os.stat decides the whole branch — a directory opens directly,
+    a file opens its parent, and a missing path can be created on
+    request — instead of separate exists/is_dir/parent probes.
+    """
+    raw = kwargs["parmtuple"].eval()[0]
+    dir_path = hou.text.expandString(raw)
+    # A string with no separator can never be a usable path; reject it
+    # with a pure in-memory scan before spending a syscall on it.
+    if "/" not in dir_path and "\\" not in dir_path:
+        hou.ui.displayMessage(f"'{raw}' is not a valid path.")
+        return
+    try:
+        st = os.stat(dir_path)
+    except OSError:
+        st = None
+    if st is not None:
+        target = dir_path if stat.S_ISDIR(st.st_mode) else os.path.dirname(dir_path)
+        _reveal(target)
+        return
+    choice = hou.ui.displayMessage(
+        f"'{dir_path}' does not exist. Create it?",
+        buttons=("Create", "Cancel"),
+    )
+    if choice == 0:
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        _reveal(dir_path)
@@ -0,0 +1,67 @@
+"""Color conversion helpers shared by the palette tools."""
+import functools
+
+import numpy as np
+
+
+def hex_to_float_rgb(hex_str: str) -> tuple:
+    """Convert ``RRGGBB`` or ``RGB`` (optionally ``#``-prefixed) to float RGB.
+
+    Args:
+        hex_str: Six hex digits, or the three-digit shorthand, with or
+            without a leading ``#``.
+
+    Returns:
+        An ``(r, g, b)`` tuple of floats in 0-1.
+    """
+    # Slice only when the prefix is present; lstrip allocates a copy
+    # even for the common bare-digits case.
+    h = hex_str[1:] if hex_str.startswith("#") else hex_str
+    if len(h) == 3:
+        h = "".join(c * 2 for c in h)
+    b = bytes.fromhex(h)
+    return (b[0] / 255.0, b[1] / 255.0, b[2] / 255.0)
+
+
+def float_rgb_to_hex(r: float, g: float, b: float) -> str:
+    """Convert float RGB components in 0-1 to an uppercase ``RRGGBB`` string."""
+    return bytes((int(r * 255), int(g * 255), int(b * 255))).hex().upper()
+
+
+#: Houdini's default network-view palette, as shown in the color picker.
+_DEFAULT_PALETTE_HEX = [
+    "000000", "2E2E2E", "4D4D4D", "666666", "808080", "999999",
+    "B3B3B3", "CCCCCC", "E6E6E6", "FFFFFF", "591F1F", "993333",
+    "CC3333", "E64C4C", "B3592E", "CC6633", "E5994D", "F2C279",
+    "7F6618", "B2992E", "E5CC4C", "F2E67F", "1F591F", "339933",
+    "4CB34C", "7FCC7F", "1F4C59", "2E8099", "4CA6CC", "7FC4E5",
+    "1F1F59", "333399", "4C4CCC", "7F7FE5", "591F59", "994C99",
+]
+
+
+#: The palette as a (36, 3) float32 array, built once at import so
+#: color math against it vectorizes.
+_DEFAULT_PALETTE = np.array(
+    [hex_to_float_rgb(h) for h in _DEFAULT_PALETTE_HEX], dtype=np.float32
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_default_palette() -> tuple:
+    """Return the 36 default network-view palette colors as float RGB tuples.
+
+    Cached and immutable so callers can share (and reverse-iterate) it
+    without copying.
+    """
+    return tuple(map(tuple, _DEFAULT_PALETTE.tolist()))
+
+
+def nearest_palette_color(rgb) -> tuple:
+    """Return the default palette color closest to ``rgb``.
+
+    A single squared-distance pass over the palette array; no Python
+    loop per entry.
+    """
+    diffs = _DEFAULT_PALETTE - np.asarray(rgb, dtype=np.float32)
+    index = int(np.argmin(np.einsum("ij,ij->i", diffs, diffs)))
+    return tuple(_DEFAULT_PALETTE[index].tolist())
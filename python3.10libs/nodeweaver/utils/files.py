@@ -0,0 +1,105 @@
+"""File helpers shared across the Node Weaver tools."""
+import copy
+import functools
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# Pick the parse/serialize backend once at import time; callers never
+# branch on which library is present.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _read_json_cached(path_str: str, mtime: float) -> Any:
+    """Parse ``path_str``; ``mtime`` keys the cache to the file version."""
+    with open(path_str, "rb") as f:
+        raw = f.read()
+    if not raw:
+        return None
+    return _loads(raw)
+
+
+def read_json(path) -> Any:
+    """Read and parse a JSON file.
+
+    Repeat reads of an unchanged file are served from a small cache
+    keyed on the file's modification time; editing the file on disk
+    invalidates its entry.
+
+    Args:
+        path: Path to the file, as a string or Path.
+
+    Returns:
+        The parsed JSON data, or None when the file is missing,
+        unreadable, empty or not valid JSON — callers fed paths from
+        parms cannot assume the file still exists.
+    """
+    path_str = os.fspath(path)
+    try:
+        data = _read_json_cached(path_str, os.path.getmtime(path_str))
+    except (OSError, ValueError):
+        # ValueError covers both backends' decode errors.
+        return None
+    # The cache holds one shared parse per file; hand each caller its
+    # own copy so mutating a result cannot poison later reads.
+    return copy.deepcopy(data)
+
+
+def iter_json_files(root):
+    """Yield every ``.json`` file under ``root`` as a Path, lazily.
+
+    Walks with os.scandir — one syscall per directory entry — and never
+    materializes a list, so memory stays flat on large config trees.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield Path(entry.path)
+
+
+def write_json_streaming(path, items) -> None:
+    """Write a JSON object from an iterable of ``(key, value)`` pairs.
+
+    Each value is serialized as it is produced, so only one key's data
+    needs to exist in memory at a time — useful for exporters whose values
+    are generated lazily.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        first = True
+        for key, value in items:
+            if first:
+                first = False
+            else:
+                f.write(", ")
+            json.dump(key, f)
+            f.write(": ")
+            json.dump(value, f)
+        f.write("}")
+
+
+def write_json(path, data) -> None:
+    """Write ``data`` to ``path`` as indented JSON, creating parent dirs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_dumps(data))
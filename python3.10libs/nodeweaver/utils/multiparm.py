@@ -0,0 +1,222 @@
+"""Multiparm layer utilities: swap, duplicate and reset layer instances.
+
+The entry points take the ``kwargs`` dict of an HDA button living
+inside the multiparm block, plus the name of the multiparm count parm.
+"""
+import hou
+
+#: Flip on when developing; a module global keeps the debug plumbing
+#: out of the hot call signatures.
+_DEBUG = False
+
+#: Hoisted so the reset loop compares against a module constant
+#: instead of doing the attribute chain per parm.
+_RAMP = hou.parmTemplateType.Ramp
+
+#: Template types whose values swap directly; the frozenset is built
+#: once instead of a list literal per template iteration.
+_SWAPPABLE_TYPES = frozenset(
+    {
+        hou.parmTemplateType.Int,
+        hou.parmTemplateType.Float,
+        hou.parmTemplateType.String,
+        hou.parmTemplateType.Toggle,
+        hou.parmTemplateType.Menu,
+    }
+)
+
+_FOLDER = hou.parmTemplateType.Folder
+_MULTIPARM_BLOCK = hou.folderType.MultiparmBlock
+
+#: Component suffixes per naming scheme; one dict hit replaces the
+#: per-component if/elif chain over hou.parmNamingScheme.
+_VEC_SUFFIX = {
+    hou.parmNamingScheme.XYZW: ("x", "y", "z", "w"),
+    hou.parmNamingScheme.RGBA: ("r", "g", "b", "a"),
+    hou.parmNamingScheme.UVW: ("u", "v", "w"),
+    hou.parmNamingScheme.Base1: ("1", "2", "3", "4"),
+}
+
+
+#: Toggle raw values arrive as strings; parm.set wants ints.
+_COERCE = {"on": 1, "off": 0}
+
+
+def _snapshot(parm):
+    """A parm's transferable value: its keyframe tuple, or the coerced
+    raw value when it has none."""
+    kf = parm.keyframes()
+    if kf:
+        return kf
+    raw = parm.rawValue()
+    return _COERCE.get(raw, raw)
+
+
+def _apply(parm, value) -> None:
+    """Write a _snapshot result onto ``parm``."""
+    parm.deleteAllKeyframes()
+    if isinstance(value, tuple):
+        parm.setKeyframes(value)
+    else:
+        parm.set(value)
+
+
+def swapValues(parm_a, parm_b, duplicate: bool = False) -> None:
+    """Swap (or copy, with ``duplicate``) values between two parms.
+
+    Keyframes travel with the values. Each parm is snapshotted once up
+    front; one write path handles every keyframe/raw combination
+    instead of four hand-expanded branches.
+    """
+    if _DEBUG:
+        print(f"swapValues: {parm_a.name()} <-> {parm_b.name()}")
+    val_a = _snapshot(parm_a)
+    val_b = _snapshot(parm_b)
+    if not duplicate:
+        _apply(parm_a, val_b)
+    _apply(parm_b, val_a)
+
+
+def prepForSwap(
+    kwargs: dict,
+    mparm_name: str,
+    swap_dir: int = 1,
+    duplicate: bool = False,
+) -> None:
+    """Swap a multiparm layer with its neighbour in ``swap_dir``.
+
+    Walks the multiparm block's templates, resolves each one to the
+    concrete parm names of the current and neighbouring layer, and
+    swaps them pairwise — including vector components and nested
+    multiparm blocks.
+    """
+    node = kwargs["node"]
+    mparm = node.parm(mparm_name)
+    count = mparm.evalAsInt()
+    index = int(kwargs["script_multiparm_index"])
+    target = index + swap_dir
+    if target < 1 or target > count:
+        return
+    if _DEBUG:
+        print(f"prepForSwap: layer {index} -> {target} on {mparm_name}")
+
+    # One bulk fetch; inner loops hit this dict instead of node.parm().
+    parm_lookup = {p.name(): p for p in node.parms()}
+
+    templates = mparm.parmTemplate().parmTemplates()
+    # The outer nesting indices are fixed for the whole call; resolve
+    # them from kwargs once instead of per template (and per child).
+    max_depth = max((t.name().count("#") for t in templates), default=1)
+    outer_index = {}
+    for d in range(2, max_depth + 2):
+        key = "script_multiparm_index" + str(d)
+        if key in kwargs:
+            outer_index[d] = str(kwargs[key])
+
+    for parm_template in templates:
+        name = parm_template.name()
+        nesting_depth = name.count("#")
+        # Both sides share the outer prefix; substitute it once, then
+        # fork on the layer index.
+        for d in range(nesting_depth, 1, -1):
+            name = name.replace("#", outer_index[d], 1)
+        parm_name = name.replace("#", str(index))
+        parm_swap_name = name.replace("#", str(target))
+
+        if parm_template.type() in _SWAPPABLE_TYPES:
+            if parm_template.numComponents() > 1:
+                suffixes = _VEC_SUFFIX.get(
+                    parm_template.namingScheme(), ("1", "2", "3", "4")
+                )
+                for c in range(parm_template.numComponents()):
+                    vec_comp = suffixes[c]
+                    parm_a = parm_lookup.get(parm_name + vec_comp)
+                    parm_b = parm_lookup.get(parm_swap_name + vec_comp)
+                    if parm_a is not None and parm_b is not None:
+                        swapValues(parm_a, parm_b, duplicate)
+            else:
+                parm_a = parm_lookup.get(parm_name)
+                parm_b = parm_lookup.get(parm_swap_name)
+                if parm_a is not None and parm_b is not None:
+                    swapValues(parm_a, parm_b, duplicate)
+
+        elif (
+            parm_template.type() == _FOLDER
+            and parm_template.folderType() == _MULTIPARM_BLOCK
+        ):
+            # Bind both count parms and their values once; the padding
+            # loops work from the locals instead of re-resolving the
+            # parm and re-evaluating it per instance.
+            nested_parm = node.parm(parm_name)
+            swap_parm = node.parm(parm_swap_name)
+            nested_count = nested_parm.evalAsInt()
+            swap_count = swap_parm.evalAsInt()
+            # Pad the shorter side so every instance has a swap partner.
+            for n in range(nested_count, swap_count):
+                nested_parm.insertMultiParmInstance(n)
+            for n in range(swap_count, nested_count):
+                swap_parm.insertMultiParmInstance(n)
+            if _DEBUG:
+                print(
+                    f"prepForSwap: nested {parm_name} "
+                    f"({nested_count} <-> {swap_count})"
+                )
+            # The template tuple and the substituted name stems are
+            # invariant across instances; build them once, then the
+            # inner loop only fills in the instance number.
+            nested_templates = nested_parm.parmTemplate().parmTemplates()
+            child_stems = []
+            for child in nested_templates:
+                child_name = child.name()
+                child_depth = child_name.count("#")
+                for d in range(child_depth, 2, -1):
+                    child_name = child_name.replace("#", outer_index[d], 1)
+                child_stems.append(
+                    (
+                        child_name.replace("#", str(index), 1),
+                        child_name.replace("#", str(target), 1),
+                    )
+                )
+            for j in range(1, max(nested_count, swap_count) + 1):
+                for stem_a, stem_b in child_stems:
+                    parm_a = node.parm(stem_a.replace("#", str(j)))
+                    parm_b = node.parm(stem_b.replace("#", str(j)))
+                    if parm_a is not None and parm_b is not None:
+                        swapValues(parm_a, parm_b, duplicate)
+
+
+def resetLayer(kwargs: dict, mparm_name: str) -> None:
+    """Revert every parm of the button's multiparm layer to defaults.
+
+    Blocks without nested multiparm children stride evenly, so the
+    layer's parms come from one slice; a nested block makes per-layer
+    counts depend on each layer's own instance count, so those blocks
+    always filter on the instance index rather than risk slicing into
+    neighbouring layers.
+    """
+    node = kwargs["node"]
+    layerNum = int(kwargs["script_multiparm_index"])
+    mparm = node.parm(mparm_name)
+    count = mparm.evalAsInt()
+    if count < 1:
+        return
+    allParms = mparm.multiParmInstances()
+    # Static layout check: divisibility alone can hold by coincidence
+    # when nested counts differ by an even amount.
+    nested = any(
+        t.type() == _FOLDER and t.folderType() == _MULTIPARM_BLOCK
+        for t in mparm.parmTemplate().parmTemplates()
+    )
+    if not nested and len(allParms) % count == 0:
+        per_layer = len(allParms) // count
+        layer_parms = allParms[(layerNum - 1) * per_layer : layerNum * per_layer]
+    else:
+        layer_parms = [
+            p for p in allParms if p.multiParmInstanceIndices()[-1] == layerNum
+        ]
+    for parm in layer_parms:
+        if parm.parmTemplate().type() is _RAMP:
+            continue
+        if _DEBUG:
+            print(f"resetLayer: reverting {parm.name()}")
+        parm.revertToDefaults()
@@ -0,0 +1,109 @@
+"""Prepare the docs tree for an mkdocs build.
+
+Copies the repo-level markdown into ``docs/``, rewrites repo-relative links
+to docs-site paths, and exposes the python package to mkdocstrings.
+"""
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+DOCS = ROOT / "docs"
+
+#: Strips the ``docs/`` prefix out of markdown links, compiled once.
+_DOCS_PREFIX_RE = re.compile(r"\[([^\]]+)\]\(docs/")
+
+#: Fixed-string link rewrites applied to every copied page, in order.
+#: ``../README.md`` maps straight to its final form rather than passing
+#: through ``../index.md`` and being rewritten a second time.
+_REPLACEMENTS = [
+    ("../README.md", "index.md"),
+    ("../index.md", "index.md"),
+    ("./README.md", "README.md"),
+]
+
+#: Substrings whose absence means fix_doc_links has nothing to do.
+_LINK_TOKENS = ("](docs/", "README.md", "../index.md", "troubleshooting.md")
+
+#: Extra rewrites for pages copied into the features subfolder.
+_FEATURES_REPLACEMENTS = [
+    ("troubleshooting.md", "../troubleshooting.md"),
+]
+
+#: destination -> source for the markdown pages mirrored into docs/.
+FILE_MAP = {
+    DOCS / "index.md": ROOT / "README.md",
+}
+
+
+def fix_doc_links(content: str, is_features: bool = False) -> str:
+    """Rewrite repo-relative markdown links for the docs site.
+
+    Args:
+        content: The markdown text to rewrite.
+        is_features: Whether the page lives in the features subfolder.
+    """
+    # Most pages contain no rewritable links; one scan beats running
+    # every replacement over them.
+    if not any(token in content for token in _LINK_TOKENS):
+        return content
+    content = _DOCS_PREFIX_RE.sub(r"[\1](", content)
+    for old, new in _REPLACEMENTS:
+        content = content.replace(old, new)
+    if is_features:
+        for old, new in _FEATURES_REPLACEMENTS:
+            content = content.replace(old, new)
+    return content
+
+
+def link_package() -> None:
+    """Expose the nodeweaver package inside docs/ for mkdocstrings."""
+    target = DOCS / "nodeweaver"
+    source = ROOT / "python3.10libs" / "nodeweaver"
+    if target.exists():
+        return
+    try:
+        os.symlink(source, target, target_is_directory=True)
+    except OSError:
+        # Windows symlinks need elevation, but directory junctions do
+        # not — create one instead of duplicating the package tree.
+        if os.name == "nt":
+            result = subprocess.run(
+                ["cmd", "/c", "mklink", "/J", str(target), str(source)],
+                capture_output=True,
+            )
+            if result.returncode == 0:
+                return
+        shutil.copytree(source, target)
+
+
+def _copy_page(dest: Path, src: Path) -> None:
+    """Copy one mapped page into docs/ with its links rewritten."""
+    content = src.read_text(encoding="utf-8")
+    content = fix_doc_links(content, is_features="features" in dest.parts)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_text(content, encoding="utf-8")
+
+
+def setup_docs() -> None:
+    """Copy and rewrite every mapped page, then link the package."""
+    DOCS.mkdir(exist_ok=True)
+    # The copies are independent and I/O-bound, so overlap them, but
+    # drain the futures so a failed copy still fails the build.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(_copy_page, dest, src) for dest, src in FILE_MAP.items()
+        ]
+        for future in futures:
+            future.result()
+    images = ROOT / "images"
+    if images.exists():
+        shutil.copytree(images, DOCS / "images", dirs_exist_ok=True)
+    link_package()
+
+
+if __name__ == "__main__":
+    setup_docs()
@@ -0,0 +1,268 @@
+"""Regenerate the auto-generated __init__.py files of the nodeweaver package.
+
+Run from the repo root after adding or renaming modules:
+
+    python update_init.py
+
+The public classes and functions of each module are discovered with ast,
+so nothing here imports hou.
+"""
+import ast
+import functools
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+import _ast_cache
+
+ROOT = Path(__file__).parent
+PACKAGE_DIR = ROOT / "python3.10libs" / "nodeweaver"
+
+#: Compiled once at import; each generated file is one render call.
+_ENV = Environment(
+    loader=FileSystemLoader(ROOT / "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+
+#: Core modules re-exported from nodeweaver.core, in presentation order.
+ORDERED_MODULES = ["hda_utils", "network_builder", "node_shape", "script_generator"]
+
+#: Manager modules re-exported from nodeweaver.managers.
+MANAGER_MODULES = ["color_palette", "gradient", "text_color"]
+
+#: Utility modules exposed as submodules of nodeweaver.utils.
+UTIL_MODULES = ["action_buttons", "colors", "files", "multiparm", "parsing"]
+
+_NO_DESC = "No description available."
+
+#: The grammar the package targets; newer syntax fails fast at parse.
+_PY_FV = (sys.version_info.major, sys.version_info.minor)
+
+def _content_hash(payload) -> str:
+    """Digest of the data a generated file is rendered from.
+
+    Stable across runs for unchanged input, so regeneration is
+    byte-idempotent and the unchanged-write skip can hit.
+    """
+    return hashlib.sha256(repr(payload).encode()).hexdigest()[:16]
+
+
+def _first_doc_line(node) -> str:
+    """First docstring line of a ClassDef/FunctionDef, without the
+    whitespace normalization ast.get_docstring does for lines we drop."""
+    body = node.body
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+        and isinstance(body[0].value.value, str)
+    ):
+        first = body[0].value.value.partition("\n")[0].strip()
+        if first:
+            return first
+    return _NO_DESC
+
+
+def getClassesAndFunctions(file_path: Path):
+    """Extract {name: first doc line} dicts for a module's public API.
+
+    Underscore-prefixed names and HDA parm callbacks (functions whose
+    only argument is ``kwargs``) are treated as module-internal.
+
+    Results are memoized for the run keyed on (path, mtime, size) —
+    updateInv_io revisits every module updateInit already parsed — and
+    cached on disk keyed by a digest of the file bytes plus the Python
+    version, so unchanged sources skip ast.parse across runs too.
+    """
+    return _extract_module_info(file_path)[:2]
+
+
+def getAllFromInit(init_path: Path):
+    """Return the ``__all__`` list of an existing __init__.py, if any."""
+    if not init_path.exists():
+        return []
+    return _extract_module_info(init_path)[2]
+
+
+def _extract_module_info(file_path: Path):
+    st = file_path.stat()
+    return _parse_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_cached(path_str: str, mtime_ns: int, size: int):
+    """Parse a module once and extract classes, functions and __all__."""
+    data = Path(path_str).read_bytes()
+    digest = hashlib.sha256(
+        data + f"|v2|{sys.version_info.major}.{sys.version_info.minor}".encode()
+    ).hexdigest()
+    cached = _ast_cache.load(digest)
+    if cached is not None:
+        return cached
+
+    # Nothing to extract from stubs with no definitions or __all__; a
+    # C-level substring scan is far cheaper than building an AST.
+    if (
+        b"def " not in data
+        and b"class " not in data
+        and b"__all__" not in data
+    ):
+        return {}, {}, []
+
+    tree = ast.parse(
+        data, filename=path_str, type_comments=False, feature_version=_PY_FV
+    )
+    classes = {}
+    functions = {}
+    all_list = []
+    for item in tree.body:
+        if isinstance(item, ast.ClassDef) and not item.name.startswith("_"):
+            classes[item.name] = _first_doc_line(item)
+        elif isinstance(item, ast.FunctionDef) and not item.name.startswith("_"):
+            if [a.arg for a in item.args.args] == ["kwargs"]:
+                continue
+            functions[item.name] = _first_doc_line(item)
+        elif isinstance(item, ast.Assign):
+            for target in item.targets:
+                if isinstance(target, ast.Name) and target.id == "__all__":
+                    all_list = [elt.value for elt in item.value.elts]
+    payload = (classes, functions, all_list)
+    _ast_cache.store(digest, payload)
+    return payload
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write ``content`` unless the file already matches byte for byte.
+
+    Generated files carry a content hash rather than a timestamp, so an
+    unchanged module surface renders identically and the skip leaves
+    the file's mtime alone for downstream tools (IDEs, Houdini's
+    reloader).
+    """
+    try:
+        existing = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = ""
+    if existing == content:
+        return
+    path.write_text(content, encoding="utf-8")
+
+
+def _parse_batch(named_paths):
+    """Parse ``(name, path)`` pairs concurrently; returns {name: result}.
+
+    Parsing is dominated by file reads, which release the GIL, so a
+    small thread pool overlaps them; callers merge in their own order.
+    """
+    if not named_paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(named_paths))) as pool:
+        results = pool.map(getClassesAndFunctions, [p for _, p in named_paths])
+        return {name: result for (name, _), result in zip(named_paths, results)}
+
+
+def updateInit(package_dir: Path):
+    """Regenerate core, managers and utils __init__.py files.
+
+    Returns:
+        A ``(module_items, descriptions)`` pair: the per-module public
+        name dicts, and a flat {name: description} mapping.
+    """
+    core_dir = package_dir / "core"
+    module_items = {}
+    descriptions = {}
+    module_names = []
+    all_names = []
+    # One directory read instead of a stat per candidate module.
+    children = {e.name for e in os.scandir(core_dir) if e.is_file()}
+    present = [
+        (module, core_dir / f"{module}.py")
+        for module in ORDERED_MODULES
+        if f"{module}.py" in children
+    ]
+    # The reads dominate parse time; overlap them, then merge in order.
+    parsed = _parse_batch(present)
+    for module, file_path in present:
+        classes, functions = parsed[module]
+        names = sorted(classes) + sorted(functions)
+        if not names:
+            continue
+        module_names.append((module, names))
+        all_names.extend(names)
+        module_items[module] = (classes, functions)
+        descriptions.update(classes)
+        descriptions.update(functions)
+
+    content = _ENV.get_template("init.py.j2").render(
+        title="Core tool implementations for Node Weaver.",
+        content_hash=_content_hash((module_names, sorted(all_names))),
+        modules=module_names,
+        all_names=sorted(all_names),
+        kind="core",
+        reload_modules=list(module_items),
+    )
+    _write_if_changed(core_dir / "__init__.py", content)
+
+    managers_dir = package_dir / "managers"
+    # One directory read replaces a stat per manager module, matching
+    # the core and utils loops.
+    manager_children = {e.name for e in os.scandir(managers_dir) if e.is_file()}
+    manager_present = [
+        (manager, managers_dir / f"{manager}.py")
+        for manager in MANAGER_MODULES
+        if f"{manager}.py" in manager_children
+    ]
+    manager_parsed = _parse_batch(manager_present)
+    manager_names = [
+        (manager, sorted(manager_parsed[manager][0])) for manager, _ in manager_present
+    ]
+    manager_all = sorted(name for _, names in manager_names for name in names)
+    content = _ENV.get_template("managers_init.py.j2").render(
+        content_hash=_content_hash((manager_names, manager_all)),
+        modules=manager_names,
+        all_names=manager_all,
+        kind="manager",
+        reload_modules=[manager for manager, _ in manager_names],
+    )
+    _write_if_changed(managers_dir / "__init__.py", content)
+
+    utils_dir = package_dir / "utils"
+    util_children = {e.name for e in os.scandir(utils_dir) if e.is_file()}
+    util_names = [m for m in UTIL_MODULES if f"{m}.py" in util_children]
+    content = _ENV.get_template("utils_init.py.j2").render(
+        title="Shared utilities for Node Weaver.",
+        content_hash=_content_hash(util_names),
+        modules=util_names,
+    )
+    _write_if_changed(utils_dir / "__init__.py", content)
+
+    return module_items, descriptions
+
+
+def updateInv_io(package_dir: Path) -> None:
+    """Regenerate the top-level nodeweaver/__init__.py."""
+    module_items, _ = updateInit(package_dir)
+
+    # Summarize each core module's public surface for the docstring,
+    # straight from updateInit's result — no second module walk.
+    summary = [
+        f"{module}: {', '.join(sorted(classes) + sorted(functions))}"
+        for module, (classes, functions) in module_items.items()
+    ]
+
+    content = _ENV.get_template("inv_io.py.j2").render(
+        content_hash=_content_hash(summary),
+        summary=summary,
+        subpackages=["core", "managers", "utils"],
+    )
+    _write_if_changed(package_dir / "__init__.py", content)
+
+
+if __name__ == "__main__":
+    updateInv_io(PACKAGE_DIR)